@@ -21,6 +21,7 @@ from __future__ import annotations
 import collections.abc
 import contextlib
 import itertools
+import operator
 import sys
 import typing
 
@@ -42,6 +43,12 @@ __all__ = (
     'lazylist',
 )
 
+# Marks the end of an iterator or of the shorter list when comparing
+_SENTINEL: Any = object()
+
+# Placeholder for tails that have been removed
+_EXHAUSTED: Iterator[Any] = iter(())
+
 
 class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-name
     """List-like object that grows lazily.
@@ -129,33 +136,12 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     """
 
-    class _lazylist_iterator(typing.Iterator[_T]):    # pylint:disable=invalid-name
-        """Internal iterator for lazylist."""
-
-        _iterable: lazylist[_T]
-        _next_index: int
-
-        def __init__(self, iterable: lazylist[_T]) -> None:
-            """Create a lazylist iterator."""
-            self._iterable = iterable
-            self._next_index = 0
-
-        def __next__(self) -> _T:
-            """Get the next element from a lazylist."""
-            self._iterable._make_strict(self._next_index)  # pylint:disable=protected-access
-            try:
-                res = self._iterable[self._next_index]
-                self._next_index += 1
-                return res
-            except IndexError:
-                raise StopIteration() from None
-
-        def __iter__(self) -> Self:
-            """Return self."""
-            return self
+    __slots__ = ('_strict', '_tails', '_tails_head', '_owned_tail', '__weakref__')
 
     _strict: list[_T]
-    _tails: collections.deque[Iterator[_T] | list[_T]]
+    _tails: list[Iterator[_T] | list[_T]]
+    _tails_head: int
+    _owned_tail: list[_T] | None
 
     def __init__(self, iterable: Iterable[_T] | None = None) -> None:
         """Create a lazylist object.
@@ -170,17 +156,55 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
         """
         self._strict = []
-        self._tails = collections.deque()
+        self._tails = []
+        self._tails_head = 0
+        self._owned_tail = None
         if iterable is not None:
             self._add_tail(iterable)
 
     def _add_tail(self, other: Iterable[_T]) -> None:
         """Add a tail to the lazylist object."""
         if isinstance(other, list):
-            self._tails.append(other.copy())
+            self._add_list_tail(other)
+        elif isinstance(other, lazylist):
+            self._add_lazylist_tails(other.copy())
         else:
             self._tails.append(iter(other))
-        self._advance_tail()
+
+    def _add_list_tail(self, other: list[_T]) -> None:
+        """Add a list to the lazylist object.
+
+        If the lazylist is strict, the elements are added to the strict
+        part directly. If the last tail is a list owned by the lazylist
+        they are added to that list. Otherwise a copy of the list is
+        added as a tail.
+
+        """
+        if not self._tails:
+            self._strict.extend(other)
+        elif self._tails[-1] is self._owned_tail:
+            self._owned_tail.extend(other)
+        else:
+            self._owned_tail = other.copy()
+            self._tails.append(self._owned_tail)
+
+    def _add_lazylist_tails(self, other: lazylist[_T]) -> None:
+        """Add the contents of another lazylist to the lazylist object.
+
+        The strict part and tails of the other lazylist are taken over
+        as they are, so the other lazylist must not be used afterwards.
+        Pass a copy if it is still needed.
+
+        """
+        strict = other._strict  # pylint:disable=protected-access
+        tails = other._tails[other._tails_head:]  # pylint:disable=protected-access
+        if strict:
+            if self._tails:
+                self._owned_tail = strict
+                self._tails.append(strict)
+            else:
+                self._strict.extend(strict)
+        self._tails.extend(tails)
 
     def _advance_tail(self) -> None:
         """Advance to the next tail.
@@ -190,13 +214,49 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
         retrieved.
 
         """
-        while self._tails and isinstance(self._tails[0], list):
-            self._strict.extend(self._tails.popleft())
+        while self._tails and isinstance(self._tails[self._tails_head], list):
+            self._strict.extend(self._pop_tail())
+
+    def _fetch(self) -> Iterator[_T]:
+        """Fetch elements from the tails into the strict part.
+
+        Each element is yielded once it has been added to the strict
+        part, so the caller can stop as soon as it has seen enough.
+
+        """
+        while self._tails:
+            for element in self._tails[self._tails_head]:
+                self._strict.append(element)
+                yield element
+            self._pop_tail()
+            start = len(self._strict)
+            self._advance_tail()
+            yield from self._strict[start:]
 
     def _is_strict(self) -> bool:
         """Check if all elements have been retrieved."""
         return not self._tails
 
+    def _pop_tail(self) -> Iterator[_T] | list[_T]:
+        """Remove and return the current tail.
+
+        The tails are kept in a list, with _tails_head pointing at the
+        current one. Removed tails are replaced by an empty iterator
+        so they can be freed, and are dropped from the list once they
+        make up half of it. When there are no tails left, the list is
+        empty and _tails_head is zero.
+
+        """
+        tail = self._tails[self._tails_head]
+        self._tails[self._tails_head] = _EXHAUSTED
+        if tail is self._owned_tail:
+            self._owned_tail = None
+        self._tails_head += 1
+        if self._tails_head * 2 >= len(self._tails):
+            del self._tails[:self._tails_head]
+            self._tails_head = 0
+        return tail
+
     def _make_strict(self, index: SupportsIndex | slice | None = None) -> None:
         """Make the lazylist strict up to a given index.
 
@@ -214,39 +274,71 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
         if not self._tails:
             return
 
-        # Special case
-        if index is None:
-            for tail in self._tails:
-                self._strict.extend(list(tail))
-            self._tails.clear()
-            return
-
-        # If index is a slice make start and and strict
         if isinstance(index, slice):
-            start, stop, step = index.indices(sys.maxsize)
-            if step > 0 and start < stop:
-                self._make_strict(index.stop - 1 if index.stop else index.stop)
-            elif step < 0 and start > stop:
-                self._make_strict(index.start if index.start else index.start)
+            self._make_slice_strict(index)
             return
 
-        # If index is a negative integer, make everything strict
-        index_value = index.__index__()
+        # If index is None or a negative integer, make everything strict.
+        # Each tail is extended from separately rather than through a
+        # single chain, so list.extend can copy list tails directly and
+        # pre-size for iterators that have a length hint
+        index_value = -1 if index is None else index.__index__()
         if index_value < 0:
-            self._make_strict()
+            while self._tails:
+                self._strict.extend(self._pop_tail())
             return
 
-        # If index is a non-negative integer, iterate to it
-        while self._tails and len(self._strict) <= index_value:
-            try:
-                self._strict.append(next(self._tails[0]))  # type: ignore[arg-type]
-            except StopIteration:
-                self._tails.popleft()
-                self._advance_tail()
+        # If index is a non-negative integer, iterate to it. A single
+        # missing element is fetched directly and more are fetched in
+        # bulk; if the current tail runs out before the index is reached
+        # it is exhausted.
+        while self._tails:
+            missing = index_value + 1 - len(self._strict)
+            if missing <= 0:
+                return
+            tail = self._tails[self._tails_head]
+            if missing == 1:
+                try:
+                    self._strict.append(next(tail))  # type: ignore[arg-type]
+                    return
+                except StopIteration:
+                    pass
+            else:
+                self._strict.extend(itertools.islice(tail, missing))
+                if len(self._strict) > index_value:
+                    return
+            self._pop_tail()
+            self._advance_tail()
+
+    def _make_slice_strict(self, index: slice) -> None:
+        """Make the lazylist strict up to the last element of a slice.
+
+        Negative bounds depend on the length, so they make everything
+        strict. Open bounds normalize to indices close to sys.maxsize
+        when they need everything.
+
+        Args:
+          index: the slice to make valid in the strict part.
+
+        """
+        if (index.start is not None and index.start < 0) or (index.stop is not None and index.stop < 0):
+            self._make_strict()
+            return
+        start, stop, step = index.indices(sys.maxsize)
+        if (stop - start) * step > 0:
+            self._make_strict(stop - 1 if step > 0 else start)
 
     def __add__(self, other: Iterable[_T]) -> lazylist[_T]:
         """Create a new lazylist from this one and another."""
         res = self.copy()
+        if isinstance(other, list):
+            # Lists are copied when needed by extend
+            res += other
+            return res
+        if isinstance(other, lazylist):
+            # The copy is taken over as it is instead of being copied again
+            res._add_lazylist_tails(other.copy())
+            return res
         try:
             res += other.copy()  # type: ignore[attr-defined]
         except AttributeError:
@@ -255,7 +347,8 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     def __bool__(self) -> bool:
         """Check if this lazylist is empty."""
-        self._make_strict(0)
+        if not self._strict and self._tails:
+            self._make_strict(0)
         return bool(self._strict)
 
     def __cmp__(self, other: Any) -> Literal[-1, 0, 1]:
@@ -263,47 +356,50 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
         if not isinstance(other, (list, lazylist)):
             raise TypeError(f"comparison not supported between instances of 'lazylist' "
                             f"and '{type(other).__name__}'")
-        iter1 = enumerate(self)
-        iter2 = enumerate(other)
-        index1 = -1
-        index2 = -1
-        try:
-            while True:
-                (index1, elem1) = next(iter1)
-                (index2, elem2) = next(iter2)
-                if elem1 == elem2:
-                    continue
-                if elem1 < elem2:
-                    return -1
+        if not self._tails and not (isinstance(other, lazylist) and other._tails):
+            strict = other._strict if isinstance(other, lazylist) else other
+            if self._strict < strict:
+                return -1
+            return 0 if self._strict == strict else 1
+        for elem1, elem2 in itertools.zip_longest(self, other, fillvalue=_SENTINEL):
+            if elem1 is _SENTINEL:  # self is shorter
+                return -1
+            if elem2 is _SENTINEL:  # other is shorter
                 return 1
-        except StopIteration:
-            pass
-        # We get here on the first StopIteration
-        if index1 == index2:    # exhausted self
-            with contextlib.suppress(StopIteration):
-                next(iter2)
-                return -1       # other was longer
-            return 0            # equal lengths
-        return 1                # self is longer
+            if not (elem1 is elem2 or elem1 == elem2):
+                return -1 if elem1 < elem2 else 1
+        return 0
 
     def __contains__(self, element: Any) -> bool:
         """Check if an element is present in the lazylist."""
-        return element in self._strict or element in iter(self)
+        return element in self._strict or element in self._fetch()
+
+    def __copy__(self) -> lazylist[_T]:
+        """Create a shallow copy of this lazylist."""
+        return self.copy()
 
     def __delitem__(self, index: SupportsIndex | slice) -> None:
         """Remove an element from the lazylist."""
-        self._make_strict(index)
+        if self._tails and not (isinstance(index, int) and 0 <= index < len(self._strict)):
+            self._make_strict(index)
         del self._strict[index]
 
     def __eq__(self, other: Any) -> bool:
         """Check if two lazylists are equivalent."""
-        if not isinstance(other, (list, lazylist)):
+        if isinstance(other, lazylist):
+            if not self._tails and not other._tails:
+                return self._strict == other._strict
+        elif isinstance(other, list):
+            if not self._tails:
+                return self._strict == other
+        else:
             return False
         return self.__cmp__(other) == 0
 
     def __format__(self, format_spec: str) -> str:
         """Format a lazylist according to a format spec."""
-        self._make_strict()
+        if self._tails:
+            self._make_strict()
         return self._strict.__format__(format_spec)
 
     def __ge__(self, other: Any) -> bool:
@@ -320,7 +416,8 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     def __getitem__(self, index: SupportsIndex | slice) -> _T | list[_T]:
         """Get an element or slice from a lazylist."""
-        self._make_strict(index)
+        if self._tails and not (isinstance(index, int) and 0 <= index < len(self._strict)):
+            self._make_strict(index)
         return self._strict[index]
 
     def __gt__(self, other: Any) -> bool:
@@ -333,11 +430,21 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     def __iadd__(self, other: Iterable[_T]) -> Self:
         """Add another list to this one, in place."""
-        self._add_tail(other)
+        self.extend(other)
         return self
 
     def __imul__(self, count: int) -> Self:
         """Repeat this lazylist, in place."""
+        count = operator.index(count)
+        if not self._tails:
+            self._strict *= count
+            return self
+        if count <= 0:
+            self.clear()
+            return self
+        if count == 1:
+            return self
+
         repetitions: list[list[list[_T] | Iterator[_T]]] = [[] for _ in range(count)]
 
         def _add_repetition(item: list[_T] | Iterator[_T]) -> None:
@@ -348,18 +455,48 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
                 for repetition, tail in zip(repetitions, itertools.tee(item, count)):
                     repetition.append(tail)
 
-        _add_repetition(self._strict)
-        for tail in self._tails:
+        # The strict part stays where it is for the first repetition
+        if self._strict:
+            strict = self._strict.copy()
+            for repetition in repetitions[1:]:
+                repetition.append(strict)
+        for tail in self._tails[self._tails_head:]:
             _add_repetition(tail)
 
-        self._strict = []
-        self._tails = collections.deque(item for repetition in repetitions for item in repetition)
-        self._advance_tail()
+        self._tails = [item for repetition in repetitions for item in repetition]
+        self._tails_head = 0
+        self._owned_tail = None
         return self
 
     def __iter__(self) -> Iterator[_T]:
         """Iterate over this lazylist."""
-        return lazylist._lazylist_iterator(self)
+        # The strict part is looked up on every step since it may be
+        # replaced while iterating (e.g. when the lazylist is reversed)
+        index = 0
+        while True:
+            if index < len(self._strict):
+                yield self._strict[index]
+                index += 1
+            elif index == len(self._strict) and self._tails:
+                # At the end of the strict part: take elements straight
+                # from the current tail until the lazylist is changed by
+                # something else
+                strict = self._strict
+                tail = self._tails[self._tails_head]
+                for element in tail:
+                    strict.append(element)
+                    yield element
+                    index += 1
+                    if (strict is not self._strict or len(strict) != index
+                            or not self._tails or self._tails[self._tails_head] is not tail):
+                        break
+                else:
+                    self._pop_tail()
+                    self._advance_tail()
+            else:
+                self._make_strict(index)
+                if index >= len(self._strict):
+                    return
 
     def __le__(self, other: Any) -> bool:
         """Check if this lazylist is less than or equal to another."""
@@ -367,12 +504,13 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     def __len__(self) -> int:
         """Get the length of this lazylist."""
-        self._make_strict()
+        if self._tails:
+            self._make_strict()
         return len(self._strict)
 
     def __lt__(self, other: Any) -> bool:
         """Check if this lazylist is less than another."""
-        return not self.__ge__(other)
+        return self.__cmp__(other) < 0
 
     def __mul__(self, count: int) -> lazylist[_T]:
         """Create a lazylist that is a repeat of this one."""
@@ -384,19 +522,15 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
         """Check if this lazylist differs from another."""
         return not self.__eq__(other)
 
-    def __reduce__(self) -> tuple[type, tuple[list[_T]]]:
-        """Pickle this as a normal list."""
-        self._make_strict()
-        return (lazylist, (self._strict,))
-
-    def __reduce_ex__(self, protocol: SupportsIndex) -> tuple[type, tuple[list[_T]]]:
+    def __reduce__(self) -> tuple[type, tuple[()], None, Iterator[_T]]:
         """Pickle this as a normal list."""
-        self._make_strict()
-        return (lazylist, (self._strict,))
+        if self._tails:
+            self._make_strict()
+        return (lazylist, (), None, iter(self._strict))
 
     def __repr__(self) -> str:
         """Return a representation of this lazylist."""
-        return f'<lazylist {self._strict} {list(self._tails)}>'
+        return f'<lazylist {self._strict} {self._tails[self._tails_head:]}>'
 
     def __rmul__(self, other: int) -> lazylist[_T]:
         """Create a lazylist that is a repeat of this one."""
@@ -412,40 +546,60 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     def __setitem__(self, index: SupportsIndex | slice, value: _T | Iterable[_T]) -> None:
         """Change an element of this lazylist."""
-        self._make_strict(index)
+        if self._tails and not (isinstance(index, int) and 0 <= index < len(self._strict)):
+            self._make_strict(index)
+            if isinstance(index, slice):
+                # Assigning to an empty slice inserts at its start, so the
+                # elements before it must be strict as well
+                start, _, step = index.indices(sys.maxsize)
+                if step > 0 and start > 0:
+                    self._make_strict(start - 1)
         self._strict[index] = value  # type: ignore[index,assignment]
 
     def __str__(self) -> str:
         """Return a string representation of this lazylist."""
-        self._make_strict()
+        if self._tails:
+            self._make_strict()
         return str(self._strict)
 
     def append(self, value: _T) -> None:
         """Append an element to this lazylist."""
-        if self._is_strict():
+        if not self._tails:
             self._strict.append(value)
             return
-        with contextlib.suppress(IndexError):
-            if isinstance(self._tails[-1], list):
-                self._tails[-1].append(value)
-                return
-        self._add_tail([value])
+        # There is at least one tail since the lazylist is not strict.
+        # List tails may be shared with copies, so only a list owned
+        # by this lazylist is appended to.
+        if self._tails[-1] is self._owned_tail:
+            self._owned_tail.append(value)
+        else:
+            self._owned_tail = [value]
+            self._tails.append(self._owned_tail)
 
     def clear(self) -> None:
         """Clear this lazylist of all elements."""
         self._strict.clear()
         self._tails.clear()
+        self._tails_head = 0
+        self._owned_tail = None
 
     def copy(self) -> lazylist[_T]:
-        """Create a copy of this lazylist."""
+        """Create a copy of this lazylist.
+
+        List tails are shared between the lazylist and the copy, and
+        neither of them will modify a shared tail.
+
+        """
         other: lazylist[_T] = lazylist()
         other._strict = self._strict.copy()  # pylint:disable=protected-access
-        old_tails = self._tails
-        self._tails = collections.deque()
+        old_tails = self._tails[self._tails_head:]
+        self._tails = []
+        self._tails_head = 0
+        self._owned_tail = None
         for item in old_tails:
             if isinstance(item, list):
                 self._tails.append(item)
-                other._tails.append(item.copy())  # pylint:disable=protected-access
+                other._tails.append(item)  # pylint:disable=protected-access
             else:
                 (mine, theirs) = itertools.tee(item)
                 self._tails.append(mine)
@@ -454,7 +608,8 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     def count(self, value: Any) -> int:
         """Count occurrences of value in this lazylist."""
-        self._make_strict()
+        if self._tails:
+            self._make_strict()
         return self._strict.count(value)
 
     def extend(self, values: Iterable[_T]) -> None:
@@ -463,10 +618,21 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
 
     def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
         """Return the position of a value in this lazylist."""
-        if self._is_strict():
+        if not self._tails:
             return self._strict.index(value, start, stop)
-        for (index, element) in enumerate(self):
-            if start <= index <= stop and value == element:
+
+        # Negative positions are relative to the end of the lazylist
+        if start < 0 or stop < 0:
+            self._make_strict()
+            return self._strict.index(value, start, stop)
+
+        # Search the strict part first, then fetch one element at a
+        # time until a match or the stop position is reached
+        with contextlib.suppress(ValueError):
+            return self._strict.index(value, start, stop)
+        offset = len(self._strict)
+        for (index, element) in enumerate(itertools.islice(self._fetch(), max(stop - offset, 0)), offset):
+            if index >= start and (element is value or element == value):
                 return index
         raise ValueError
 
@@ -475,36 +641,86 @@ class lazylist(collections.abc.MutableSequence[_T]):  # pylint:disable=invalid-n
         self._make_strict(index - 1)
         self._strict.insert(index, value)
 
+    def iter_consume(self) -> Iterator[_T]:
+        """Iterate over this lazylist, removing elements as they are produced.
+
+        Elements fetched from the tails are passed on without being
+        stored in the lazylist, so consuming a long (or infinite)
+        iterator does not require keeping every element in memory.
+        Once iteration is complete the lazylist is empty. If iteration
+        is abandoned, elements that have not been produced remain.
+
+        """
+        pending: Iterator[_T] | None = None
+        try:
+            while self._strict or self._tails:
+                # Move the strict part into a tail so its elements can be
+                # taken from the front while the lazylist still holds
+                # those that remain
+                if self._strict:
+                    pending = iter(self._strict)
+                    self._tails = [pending, *self._tails[self._tails_head:]]
+                    self._tails_head = 0
+                    self._strict = []
+
+                # Stop taking elements from the tail if the lazylist was
+                # changed while the element was being consumed
+                tail = self._tails[self._tails_head]
+                for element in tail:
+                    yield element
+                    if self._strict or not self._tails or self._tails[self._tails_head] is not tail:
+                        break
+                else:
+                    self._pop_tail()
+                    self._advance_tail()
+        finally:
+            # Put what remains of the strict part back if iteration was
+            # abandoned
+            if pending is not None and self._tails and self._tails[self._tails_head] is pending:
+                self._strict.extend(self._pop_tail())
+                self._advance_tail()
+
     def pop(self, index: int = -1) -> _T:
         """Remove the last element from this lazylist."""
-        self._make_strict(index if index > 0 else None)
+        if self._tails:
+            self._make_strict(index if index > 0 else None)
         return self._strict.pop(index)
 
     def remove(self, value: Any) -> None:
         """Remove a specific value from this lazylist."""
-        self._make_strict()
+        if self._tails:
+            self._make_strict()
         self._strict.remove(value)
 
     def reverse(self) -> None:
         """Reverse list lazylist."""
+        # The owned list tail can be reversed in place, other list tails
+        # may be shared and are reversed into copies
         old_strict = self._strict
+        owned = self._owned_tail
+        if owned is not None:
+            owned.reverse()
         self._strict = []
-        self._tails = collections.deque(
-            _lazy_reversed(tail) for tail in reversed(self._tails))
+        self._tails = [tail if tail is owned else tail[::-1] if isinstance(tail, list) else _lazy_reversed(tail)
+                       for tail in reversed(self._tails[self._tails_head:])]
+        self._tails_head = 0
+        self._owned_tail = None
         if old_strict:
             old_strict.reverse()
             self._tails.append(old_strict)
+            self._owned_tail = old_strict
         self._advance_tail()
 
     def sort(self) -> None:
         """Sort this lazylist."""
-        self._make_strict()
+        if self._tails:
+            self._make_strict()
         self._strict.sort()
 
 
 def _lazy_reversed(iterable: Iterable[_T]) -> Generator[_T, None, None]:
     """Create an iterator that reverses another when needed."""
-    try:
-        yield from reversed(iterable)  # type: ignore[call-overload]
-    except TypeError:
+    if isinstance(iterable, collections.abc.Reversible):
+        yield from reversed(iterable)
+    else:
         yield from reversed(list(iterable))
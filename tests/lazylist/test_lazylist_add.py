@@ -29,6 +29,19 @@ def test_add_lazylist():
     assert act._strict == []
     assert list(act) == list(range(1, 10))
 
+def test_add_partly_strict_lazylist():
+    lst1 = lazylist(range(1, 3))
+    lst2 = lazylist([3, 4])
+    lst2.extend(range(5, 7))
+    act = lst1 + lst2
+    assert len(act._tails) == 3
+    assert act._tails[1] == [3, 4]
+    assert act._tails[1] is not lst2._strict
+    act.append(7)
+    assert list(act) == list(range(1, 8))
+    assert list(lst1) == [1, 2]
+    assert list(lst2) == [3, 4, 5, 6]
+
 def test_add_and_delete():
     lst1 = lazylist(range(1, 5))
     lst2 = lazylist(range(5, 10))
@@ -50,3 +63,11 @@ def test_add_complex():
     assert list(act) == [1, 2, 3, 4, 5, 6, 7, 8, 9,
                          'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
     assert list(lst2) == [ 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+
+def test_add_plain_list():
+    right = [4, 5]
+    strict = lazylist([1, 2, 3]) + right
+    nonstrict = lazylist(range(1, 4)) + right
+    right.append(6)
+    assert list(strict) == [1, 2, 3, 4, 5]
+    assert list(nonstrict) == [1, 2, 3, 4, 5]
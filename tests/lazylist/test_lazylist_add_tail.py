@@ -41,3 +41,21 @@ def test_add_list_to_nonstrict():
     assert act._tails[0] is iterator
     assert act._tails[1] is not lst
     assert act._tails[1] == lst
+
+def test_add_lists_to_nonstrict():
+    act = lazylist()
+    iterator = iter(range(1, 11))
+    act._add_tail(iterator)
+    act._add_tail([1, 2])
+    act._add_tail([3, 4])
+    assert len(act._tails) == 2
+    assert act._tails[1] == [1, 2, 3, 4]
+
+def test_add_list_after_shared_list():
+    act = lazylist(range(1, 3))
+    act._add_tail([3])
+    other = act.copy()
+    act._add_tail([4])
+    assert len(act._tails) == 3
+    assert other._tails[1] == [3]
+    assert list(act) == [1, 2, 3, 4]
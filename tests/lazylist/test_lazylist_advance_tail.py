@@ -8,7 +8,7 @@ def test_merge_lists():
     act.extend([2, 3])
     act.extend([4, 5])
     assert act._strict == [1]
-    assert len(act._tails) == 3
+    assert len(act._tails) == 2
     assert type(act._tails[0]) is type(iter(range(2, 5)))
     for _ in range(5):  # Iterate past the range iterator
         next(act_iter)
@@ -32,6 +32,7 @@ def test_with_iterable_tail():
     for _ in range(5):  # Iterate past the range iterator
         next(act_iter)
     act._advance_tail()
-    assert len(act._tails) == 2
-    assert act._tails[0] is iter2
-    assert act._tails[1] is iter3
+    tails = act._tails[act._tails_head:]
+    assert len(tails) == 2
+    assert tails[0] is iter2
+    assert tails[1] is iter3
@@ -10,3 +10,19 @@ def test_nonempty_iterable():
     assert bool(act) is True
     assert act._strict == [1]
     assert len(act._tails) == 1
+
+def test_nonempty_strict():
+    act = lazylist([1, 2])
+    act.extend(range(3, 11))
+    assert bool(act) is True
+    assert act._strict == [1, 2]
+    assert len(act._tails) == 1
+
+def test_empty_tails():
+    act = lazylist(iter(()))
+    act.extend(iter(()))
+    assert bool(act) is False
+    assert not act._tails
+    act.extend(range(1, 3))
+    assert bool(act) is True
+    assert act._strict == [1]
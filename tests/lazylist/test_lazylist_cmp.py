@@ -52,3 +52,16 @@ def test_types_differ():
     with pytest.raises(TypeError) as exc:
         _ = lazylist().__cmp__('abc')
     assert 'comparison' in str(exc)
+
+
+def test_strict():
+    assert lazylist([1, 2]).__cmp__(lazylist([1, 2])) == 0
+    assert lazylist([1, 2]).__cmp__(lazylist([1, 3])) == -1
+    assert lazylist([1, 2]).__cmp__([1]) == 1
+    assert lazylist([1, 2]).__cmp__(lazylist(range(1, 3))) == 0
+
+
+def test_same_object():
+    nan = float('nan')
+    assert lazylist(iter([nan])).__cmp__(lazylist(iter([nan]))) == 0
+    assert lazylist([nan]).__cmp__([nan]) == 0
@@ -14,3 +14,27 @@ def test_nonstrict():
     assert 4 in act
     assert act._strict == [1, 2, 3, 4]
     assert act._is_strict() is False
+
+def test_multiple_tails():
+    act = lazylist(range(1, 4))
+    act.extend([4, 5])
+    act.extend(range(6, 9))
+    assert 5 in act
+    assert act._strict == [1, 2, 3, 4, 5]
+    assert 0 not in act
+    assert act._strict == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert act._is_strict() is True
+
+def test_stops_at_match():
+    fetched = []
+
+    def gen():
+        for value in range(1, 10):
+            fetched.append(value)
+            yield value
+
+    act = lazylist(gen())
+    assert 3 in act
+    assert fetched == [1, 2, 3]
+    assert 3 in act
+    assert fetched == [1, 2, 3]
@@ -1,3 +1,5 @@
+import copy
+
 from lazystuff import lazylist
 
 
@@ -28,7 +30,31 @@ def test_copy_complex():
     assert lst2._strict == [1, 2, 3]
     assert lst1._strict is not lst2._strict
     assert len(lst1._tails) == len(lst2._tails)
-    assert not any(tail1 is tail2 for tail1, tail2 in zip(lst1._tails, lst2._tails))
+    for tail1, tail2 in zip(lst1._tails, lst2._tails):
+        assert (tail1 is tail2) is isinstance(tail1, list)
     _ = list(lst2)
     assert lst1._strict == [1, 2, 3]
     assert list(lst1) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+def test_copy_append():
+    lst1 = lazylist(range(1, 3))
+    lst1.extend([3, 4])
+    lst2 = lst1.copy()
+    lst1.append(5)
+    lst2.append(6)
+    lst2.append(7)
+    assert list(lst1) == [1, 2, 3, 4, 5]
+    assert list(lst2) == [1, 2, 3, 4, 6, 7]
+
+def test_copy_module():
+    lst1 = lazylist([[1], [2]])
+    lst1.extend(iter([[3], [4]]))
+    lst2 = copy.copy(lst1)
+    assert isinstance(lst2, lazylist)
+    assert lst2 is not lst1
+    assert lst2 == lst1
+    assert lst2[0] is lst1[0]
+    lst2.append([5])
+    del lst1[0]
+    assert list(lst1) == [[2], [3], [4]]
+    assert list(lst2) == [[1], [2], [3], [4], [5]]
@@ -11,6 +11,21 @@ def test_positive():
     assert act[3] == 5
     assert act._strict == [1, 2, 3, 5]
 
+def test_positive_strict_prefix():
+    act = lazylist(range(1, 11))
+    act._make_strict(3)
+    del act[0]
+    del act[2]
+    assert act._strict == [2, 3]
+    assert len(act._tails) == 1
+    assert act == [2, 3, 5, 6, 7, 8, 9, 10]
+
+def test_positive_strict():
+    act = lazylist(range(1, 11))
+    act._make_strict()
+    del act[3]
+    assert act == [1, 2, 3, 5, 6, 7, 8, 9, 10]
+
 def test_badindex_positive():
     act = lazylist(range(1, 11))
     with pytest.raises(IndexError):
@@ -33,6 +48,18 @@ def test_slice_rev():
     del act[10:0:-2]
     assert act._strict == [1, 3, 5, 7, 9]
 
+def test_slice_negative_start():
+    act = lazylist(iter([1, 2, 3]))
+    del act[-3:2]
+    assert act._strict == [3]
+    assert not act._tails
+
+def test_slice_negative_stop_rev():
+    act = lazylist(iter([1, 2, 3]))
+    del act[1:-5:-1]
+    assert act._strict == [3]
+    assert not act._tails
+
 def test_delall():
     act = lazylist(range(1, 11))
     act.extend([11, 12, 13])
@@ -75,3 +75,10 @@ def test_empty_3():
     right = lazylist(range(5))
     assert left.__eq__(right) is False
     assert left.__ne__(right) is True
+
+def test_strict():
+    left = lazylist([1, 2, 3])
+    assert left.__eq__(lazylist([1, 2, 3])) is True
+    assert left.__eq__(lazylist([1, 2])) is False
+    assert left.__eq__([1, 2, 3]) is True
+    assert left.__eq__([1, 2, 4]) is False
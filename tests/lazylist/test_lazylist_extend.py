@@ -28,3 +28,31 @@ def test_extend_complex():
     assert list(act) == [1, 2, 3, 4, 5, 6, 7, 8, 9,
                          'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
     assert list(lst2) == [ 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+
+def test_extend_lazylist_tails():
+    lst1 = act = lazylist([1, 2])
+    lst2 = lazylist([3, 4])
+    lst2.extend(range(5, 7))
+    lst2.extend([7])
+    act.extend(lst2)
+    assert act is lst1
+    assert act._strict == [1, 2, 3, 4]
+    assert len(act._tails) == 2
+    assert act._tails[1] is lst2._tails[1]
+    assert list(act) == [1, 2, 3, 4, 5, 6, 7]
+    assert lst2._strict == [3, 4]
+
+def test_extend_lazylist_to_nonstrict():
+    lst1 = lazylist(range(1, 3))
+    lst2 = lazylist([3, 4])
+    lst1.extend(lst2)
+    lst1.append(5)
+    lst2.append(6)
+    assert list(lst1) == [1, 2, 3, 4, 5]
+    assert list(lst2) == [3, 4, 6]
+
+def test_extend_self():
+    act = lazylist([1])
+    act.extend(range(2, 4))
+    act.extend(act)
+    assert list(act) == [1, 2, 3, 1, 2, 3]
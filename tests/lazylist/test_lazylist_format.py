@@ -3,3 +3,6 @@ from lazystuff import lazylist
 
 def test_format():
     assert f'{lazylist(range(1, 4))}' == '[1, 2, 3]'
+
+def test_format_strict():
+    assert f'{lazylist([1, 2, 3])}' == '[1, 2, 3]'
@@ -10,6 +10,9 @@ from lazystuff import lazylist
     ([range(1, 5)], -4, 1, [1, 2, 3, 4]),
     ([range(1, 5), [5, 6, 7], range(8, 10)], 5, 6, [1, 2, 3, 4, 5, 6, 7]),
     ([range(1, 5), [5, 6, 7], range(8, 10)], 7, 8, [1, 2, 3, 4, 5, 6, 7, 8]),
+    ([[1, 2, 3], range(4, 6)], 1, 2, [1, 2, 3]),
+    ([[1, 2, 3]], 2, 3, [1, 2, 3]),
+    ([[1, 2, 3]], -3, 1, [1, 2, 3]),
 ])
 def test_getitem_success(init, idx, exp, strict):
     lst1 = lazylist()
@@ -37,6 +40,10 @@ def test_getitem_success(init, idx, exp, strict):
     ([range(1, 10)], 4, 4, None, [], []),
     ([range(1, 10)], 5, 4, None, [], []),
     ([range(1, 10)], 4, 5, -1, [], []),
+    ([range(1, 4)], -3, 2, None, [1, 2], [1, 2, 3]),
+    ([range(1, 4)], 1, -5, -1, [2, 1], [1, 2, 3]),
+    ([range(1, 4)], -1, 5, None, [3], [1, 2, 3]),
+    ([range(1, 4)], 5, -2, -1, [3], [1, 2, 3]),
 ])
 def test_getitem_slice(init, idx1, idx2, step, exp, strict):
     lst1 = lazylist()
@@ -15,3 +15,48 @@ def test_imul_empty():
     lst1 = lazylist()
     lst1 *= 3
     assert list(lst1) == []
+
+
+def test_imul_append():
+    lst1 = lazylist(range(1, 3))
+    lst1.extend([3])
+    lst1 *= 2
+    lst1.append(4)
+    assert list(lst1) == [1, 2, 3, 1, 2, 3, 4]
+
+
+def test_imul_strict():
+    lst1 = act = lazylist([1, 2])
+    act *= 3
+    assert act is lst1
+    assert act._strict == [1, 2] * 3
+    assert act._is_strict() is True
+    act *= 0
+    assert act._strict == []
+
+
+def test_imul_nonstrict_small_counts():
+    iterator = iter(range(1, 4))
+    lst1 = lazylist(iterator)
+    lst1 *= 1
+    assert lst1._tails == [iterator]
+    assert list(lst1) == [1, 2, 3]
+    lst2 = lazylist(range(1, 4))
+    lst2 *= 0
+    assert lst2._is_strict() is True
+    assert list(lst2) == []
+
+class _Count:
+    def __init__(self, value):
+        self.value = value
+
+    def __index__(self):
+        return self.value
+
+def test_imul_index():
+    act = lazylist(range(1, 3))
+    act *= _Count(2)
+    assert list(act) == [1, 2, 1, 2]
+    act = lazylist(range(1, 3))
+    act *= _Count(1)
+    assert list(act) == [1, 2]
@@ -24,6 +24,14 @@ def test_keyword_arg_names():
     ((range(1, 6), range(6, 10), range(10, 30)), 29, None, None, 28),
     ((range(1, 6), range(6, 10), range(10, 30)), 29, None, 28, None),
     ((range(1, 6), range(6, 10), range(10, 30)), 1, 1, None, None),
+    ((range(1, 6), range(6, 10)), 7, 0, 6, None),
+    ((range(1, 6), range(6, 10)), 7, 0, 7, 6),
+    (([1, 2, 3], range(4, 10)), 2, 1, None, 1),
+    (([1, 2, 3], range(4, 10)), 8, 5, None, 7),
+    (([1, 2, 3], range(4, 10)), 2, 5, None, None),
+    ((range(1, 6), range(6, 10)), 7, -5, None, 6),
+    ((range(1, 6), range(6, 10)), 4, 0, -6, None),
+    ((range(1, 6), range(6, 10)), 3, 0, -6, 2),
 ))
 def test_index_success(init, value, start, stop, exp):
     lst1 = lazylist()
@@ -40,3 +48,20 @@ def test_index_success(init, value, start, stop, exp):
         act = lst1.index(*args)
         assert act == lst2.index(*args)
         assert act == exp
+
+def test_index_stops_at_match():
+    fetched = []
+
+    def gen():
+        for value in range(1, 10):
+            fetched.append(value)
+            yield value
+
+    act = lazylist(gen())
+    assert act.index(3) == 2
+    assert fetched == [1, 2, 3]
+    assert act.index(5, 0, 5) == 4
+    assert fetched == [1, 2, 3, 4, 5]
+    with pytest.raises(ValueError):
+        act.index(7, 0, 6)
+    assert fetched == [1, 2, 3, 4, 5, 6]
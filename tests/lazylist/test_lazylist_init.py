@@ -23,3 +23,7 @@ def test_iterator_init():
     assert act._strict == []
     assert len(act._tails) == 1
     assert act._tails[0] is init
+
+def test_no_instance_dict():
+    act = lazylist()
+    assert not hasattr(act, '__dict__')
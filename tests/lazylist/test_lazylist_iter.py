@@ -34,3 +34,45 @@ def test_iter_multi():
     assert next(iter1) == 3
     assert next(iter2) == 2
     assert lst1._strict == [1, 2, 3]
+
+def test_iter_multiple_tails():
+    lst = lazylist(range(1, 3))
+    lst.extend([3, 4])
+    lst.extend(range(5, 7))
+    assert list(iter(lst)) == [1, 2, 3, 4, 5, 6]
+    assert lst._is_strict() is True
+
+def test_iter_delete_while_iterating():
+    lst = lazylist(range(0, 5))
+    iter1 = iter(lst)
+    assert next(iter1) == 0
+    assert next(iter1) == 1
+    del lst[0]
+    assert list(iter1) == [3, 4]
+
+def test_iter_reverse_while_iterating():
+    lst1 = lazylist(range(0, 5))
+    lst2 = list(range(0, 5))
+    iter1 = iter(lst1)
+    iter2 = iter(lst2)
+    assert next(iter1) == next(iter2) == 0
+    assert next(iter1) == next(iter2) == 1
+    lst1.reverse()
+    lst2.reverse()
+    assert list(iter1) == list(iter2) == [2, 1, 0]
+
+def test_iter_clear_while_iterating():
+    lst = lazylist(range(0, 5))
+    iter1 = iter(lst)
+    assert next(iter1) == 0
+    lst.clear()
+    assert list(iter1) == []
+
+def test_iter_extend_while_iterating():
+    lst = lazylist(range(0, 2))
+    res = []
+    for element in lst:
+        res.append(element)
+        if element == 1:
+            lst.extend(range(2, 4))
+    assert res == [0, 1, 2, 3]
@@ -0,0 +1,142 @@
+import itertools
+
+from lazystuff import lazylist
+
+
+def test_consume_all():
+    act = lazylist([1, 2])
+    act.extend(range(3, 5))
+    act.extend([5, 6])
+    act.extend(range(7, 9))
+    assert list(act.iter_consume()) == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert act._strict == []
+    assert act._is_strict() is True
+
+def test_consume_nothing_stored():
+    act = lazylist(range(1, 6))
+    for element in act.iter_consume():
+        assert act._strict == []
+
+def test_consume_infinite():
+    act = lazylist(itertools.count())
+    consumer = act.iter_consume()
+    assert list(itertools.islice(consumer, 5)) == [0, 1, 2, 3, 4]
+    assert act._strict == []
+    assert act[0] == 5
+
+def test_abandon_strict():
+    act = lazylist([1, 2, 3])
+    act.extend(range(4, 6))
+    consumer = act.iter_consume()
+    assert next(consumer) == 1
+    consumer.close()
+    assert act._strict == [2, 3]
+    assert list(act) == [2, 3, 4, 5]
+
+def test_append_while_consuming():
+    act = lazylist([1, 2])
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 1:
+            act.append(3)
+    assert res == [1, 2, 3]
+    assert not act
+
+def test_fetch_while_consuming():
+    act = lazylist(range(1, 6))
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 2:
+            assert act[0] == 3
+    assert res == [1, 2, 3, 4, 5]
+    assert not act
+
+def test_exhaust_while_consuming():
+    act = lazylist(range(1, 6))
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 2:
+            assert len(act) == 3
+    assert res == [1, 2, 3, 4, 5]
+    assert not act
+
+def test_index_while_consuming_strict():
+    act = lazylist([1, 2, 3])
+    act.extend(range(4, 6))
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 1:
+            assert act[0] == 2
+            assert act[-1] == 5
+    assert res == [1, 2, 3, 4, 5]
+    assert not act
+
+def test_len_while_consuming_strict():
+    act = lazylist([1, 2, 3])
+    act.extend(range(4, 6))
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 1:
+            assert len(act) == 4
+    assert res == [1, 2, 3, 4, 5]
+    assert not act
+
+def test_inspect_while_consuming_strict_only():
+    act = lazylist([1, 2, 3])
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 1:
+            assert act[0] == 2
+            assert len(act) == 2
+            assert bool(act) is True
+            assert 2 in act
+            assert 1 not in act
+    assert res == [1, 2, 3]
+    assert not act
+
+def test_imul_while_consuming_strict():
+    act = lazylist([1, 2, 3])
+    act.extend(range(4, 6))
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 1:
+            act *= 2
+    assert res == [1, 2, 3, 4, 5, 2, 3, 4, 5]
+    assert not act
+
+def test_reverse_while_consuming_strict():
+    act = lazylist([1, 2, 3])
+    act.extend(range(4, 6))
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        if element == 1:
+            act.reverse()
+    assert res == [1, 5, 4, 3, 2]
+    assert not act
+
+def test_clear_while_consuming_strict():
+    act = lazylist([1, 2, 3])
+    res = []
+    for element in act.iter_consume():
+        res.append(element)
+        act.clear()
+    assert res == [1]
+    assert not act
+
+def test_abandon_after_fetch():
+    act = lazylist([1, 2, 3])
+    act.extend(range(4, 6))
+    consumer = act.iter_consume()
+    assert next(consumer) == 1
+    assert act[0] == 2
+    consumer.close()
+    assert act._strict == [2, 3]
+    assert list(act) == [2, 3, 4, 5]
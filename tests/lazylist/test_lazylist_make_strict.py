@@ -66,6 +66,22 @@ def test_make_strict_empty_slices():
     assert act._strict == []
     assert act._is_strict() is False
 
+
+def test_make_strict_slice_steps():
+    act = lazylist(range(1, 11))
+    act._make_strict(slice(1, 6, 3))
+    assert act._strict == [1, 2, 3, 4, 5, 6]
+    act._make_strict(slice(7, 0, -2))
+    assert act._strict == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert act._is_strict() is False
+
+
+def test_make_strict_slice_negative_bounds():
+    act = lazylist(range(1, 11))
+    act._make_strict(slice(0, -8, None))
+    assert act._strict == list(range(1, 11))
+    assert act._is_strict() is True
+
 def test_make_strict_to_index():
     act = lazylist(range(1, 5))
     act.extend(range(5, 11))
@@ -85,3 +101,28 @@ def test_empty():
     act = lazylist()
     act._make_strict()
     assert act._is_strict() is True
+
+def test_make_strict_next_exhausts_tail():
+    act = lazylist(iter([1]))
+    act.extend(range(2, 4))
+    act._make_strict(0)
+    act._make_strict(1)
+    assert act._strict == [1, 2]
+    assert len(act._tails) == 1
+
+def test_make_strict_across_tails():
+    fetched = []
+
+    def gen(start, stop):
+        for value in range(start, stop):
+            fetched.append(value)
+            yield value
+
+    act = lazylist(gen(1, 4))
+    act.extend(gen(4, 6))
+    act.extend([6, 7])
+    act.extend(gen(8, 11))
+    act._make_strict(8)
+    assert act._strict == list(range(1, 10))
+    assert fetched == [1, 2, 3, 4, 5, 8, 9]
+    assert act._is_strict() is False
@@ -1,3 +1,5 @@
+import pytest
+
 from lazystuff import lazylist
 
 
@@ -9,3 +11,10 @@ def test_mul_basic():
     assert act is not lst1
     assert act._strict == [1, 2]
     assert list(act) == [1, 2, 3, 4, 5, 6] * 3
+
+@pytest.mark.parametrize('count', (1.0, 0.0, -1.0, 2.5, '2'))
+def test_mul_non_int(count):
+    with pytest.raises(TypeError):
+        lazylist([1]) * count
+    with pytest.raises(TypeError):
+        lazylist(iter([1])) * count
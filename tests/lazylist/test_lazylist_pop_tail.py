@@ -0,0 +1,52 @@
+from lazystuff import lazylist
+
+
+def test_pop_tail():
+    iters = [iter(range(n, n + 2)) for n in range(0, 8, 2)]
+    act = lazylist()
+    for iterator in iters:
+        act.extend(iterator)
+    assert act._pop_tail() is iters[0]
+    assert act._tails_head == 1
+    assert len(act._tails) == 4
+    assert act._pop_tail() is iters[1]
+    assert act._tails_head == 0
+    assert act._tails == [iters[2], iters[3]]
+
+def test_pop_last_tail():
+    iterator = iter(range(2))
+    act = lazylist(iterator)
+    assert act._pop_tail() is iterator
+    assert act._tails == []
+    assert act._tails_head == 0
+    assert act._is_strict() is True
+
+def test_many_tails():
+    act = lazylist()
+    for n in range(0, 100, 2):
+        act.extend(iter(range(n, n + 2)))
+    assert list(act) == list(range(100))
+    assert act._tails == []
+    assert act._tails_head == 0
+
+def _partly_consumed():
+    act = lazylist()
+    for n in range(0, 8, 2):
+        act.extend(iter(range(n, n + 2)))
+    assert act[2] == 2
+    assert act._tails_head == 1
+    return act
+
+def test_rebuilt_tails_are_compact():
+    act = _partly_consumed()
+    act.reverse()
+    assert act._tails_head == 0
+    assert list(act) == [7, 6, 5, 4, 3, 2, 1, 0]
+    act = _partly_consumed()
+    act *= 2
+    assert act._tails_head == 0
+    assert list(act) == list(range(8)) * 2
+    act = _partly_consumed()
+    other = act.copy()
+    assert act._tails_head == other._tails_head == 0
+    assert list(act) == list(other) == list(range(8))
@@ -1,3 +1,4 @@
+import copy
 import pickle
 import re
 
@@ -13,20 +14,51 @@ def test_pickle_basic():
     assert act._strict == [1, 2, 3, 4, 5, 6]
     assert not act._tails
 
+def test_pickle_protocols():
+    lst = lazylist(range(1, 2001))
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        act = pickle.loads(pickle.dumps(lst, protocol))
+        assert isinstance(act, lazylist)
+        assert act._strict == list(range(1, 2001))
+        assert not act._tails
+
+def test_copy():
+    lst = lazylist([[1], [2]])
+    lst.extend(iter([[3]]))
+    act = copy.copy(lst)
+    assert isinstance(act, lazylist)
+    assert act == [[1], [2], [3]]
+    assert act[0] is lst[0]
+    act = copy.deepcopy(lst)
+    assert act == [[1], [2], [3]]
+    assert act[0] is not lst[0]
+
 def test_reduce():
     lst = lazylist([1, 2])
     lst.extend(range(3, 5))
     lst.extend([5, 6])
-    act_constructor, act_args = lst.__reduce__()
+    act_constructor, act_args, act_state, act_items = lst.__reduce__()
     assert act_constructor is lazylist
-    assert act_args == ([1, 2, 3, 4, 5, 6],)
+    assert act_args == ()
+    assert act_state is None
+    assert list(act_items) == [1, 2, 3, 4, 5, 6]
     assert lst._is_strict() is True
 
 def test_reduce_ex():
     lst = lazylist([1, 2])
     lst.extend(range(3, 5))
     lst.extend([5, 6])
-    act_constructor, act_args = lst.__reduce_ex__(1)
+    act_constructor, act_args, act_state, act_items = lst.__reduce_ex__(1)
     assert act_constructor is lazylist
-    assert act_args == ([1, 2, 3, 4, 5, 6],)
+    assert act_args == ()
+    assert act_state is None
+    assert list(act_items) == [1, 2, 3, 4, 5, 6]
     assert lst._is_strict() is True
+
+def test_reduce_strict():
+    lst = lazylist([1, 2])
+    act_constructor, act_args, act_state, act_items = lst.__reduce__()
+    assert act_constructor is lazylist
+    assert act_args == ()
+    assert act_state is None
+    assert list(act_items) == [1, 2]
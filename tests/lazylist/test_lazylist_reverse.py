@@ -1,6 +1,7 @@
 import pytest
 
 from lazystuff import lazylist
+from lazystuff.lazylist import _lazy_reversed
 
 
 @pytest.mark.parametrize('init', (
@@ -22,3 +23,37 @@ def test_reverse_success(init):
     after_strict = lst1._is_strict()
     assert before_strict is after_strict
     assert lst1 == lst2
+
+
+def test_reverse_list_tails():
+    lst1 = lazylist(range(1, 4))
+    lst1.extend([4, 5])
+    lst1.reverse()
+    assert lst1._strict == [5, 4]
+    assert len(lst1._tails) == 1
+    assert list(lst1) == [5, 4, 3, 2, 1]
+
+def test_reverse_owned_tail():
+    lst1 = lazylist([1, 2])
+    lst1.extend(range(3, 5))
+    lst1.extend([5, 6])
+    shared = lst1._tails[-1]
+    lst2 = lst1.copy()
+    lst1.extend([7])
+    lst1.reverse()
+    assert shared == [5, 6]
+    assert lst1._strict == [7, 6, 5]
+    lst1.append(0)
+    assert lst1._tails[-1] == [2, 1, 0]
+    assert list(lst1) == [7, 6, 5, 4, 3, 2, 1, 0]
+    assert list(lst2) == [1, 2, 3, 4, 5, 6]
+
+@pytest.mark.parametrize('iterable', (
+    [1, 2, 3],
+    (1, 2, 3),
+    range(1, 4),
+    iter(range(1, 4)),
+    (value for value in range(1, 4)),
+))
+def test_lazy_reversed(iterable):
+    assert list(_lazy_reversed(iterable)) == [3, 2, 1]
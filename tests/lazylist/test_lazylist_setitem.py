@@ -10,6 +10,8 @@ from lazystuff import lazylist
     ([range(1, 5)], -4, 'd', ['d', 2, 3, 4]),
     ([range(1, 5), [5, 6, 7], range(8, 10)], 5, 'e', [1, 2, 3, 4, 5, 'e', 7]),
     ([range(1, 5), [5, 6, 7], range(8, 10)], 7, 'f', [1, 2, 3, 4, 5, 6, 7, 'f']),
+    ([[1, 2, 3], range(4, 6)], 1, 'g', [1, 'g', 3]),
+    ([[1, 2, 3]], 2, 'h', [1, 2, 'h']),
 ])
 def test_getitem_success(init, idx, val, exp):
     lst1 = lazylist()
@@ -33,6 +35,14 @@ def test_getitem_success(init, idx, val, exp):
     ([range(1, 10)], 4, 2, -1, ['a', 'b'], [1, 2, 3, 'b', 'a']),
     ([range(1, 5), [5, 6, 7], range(8, 10)], 2, 8, None, ['a', 'b', 'c'],
      [1, 2, 'a', 'b', 'c']),
+    ([range(1, 4)], -3, 2, None, ['a'], ['a', 3]),
+    ([range(1, 4)], 1, -5, -1, ['a', 'b'], ['b', 'a', 3]),
+    ([range(1, 4)], 2, 2, None, ['x'], [1, 2, 'x']),
+    ([range(1, 4)], 1, 0, None, ['x'], [1, 'x']),
+    ([range(1, 4)], 0, 0, None, ['x'], ['x']),
+    ([range(1, 4)], 5, 5, None, ['x'], [1, 2, 3, 'x']),
+    ([range(1, 4)], 2, 2, 2, [], [1, 2]),
+    ([range(1, 4)], 1, 3, -1, [], []),
 ])
 def test_getitem_slice(init, idx1, idx2, step, val, exp):
     lst1 = lazylist()